@@ -3,7 +3,8 @@ import random
 from typing import Literal, Optional
 
 from src.market import Market
-from src.utils import Action, operation_sign
+from src.strategy import Strategy
+from src.utils import Action, check_trend_direction, operation_sign
 
 class Agent(ABC):
     """
@@ -76,9 +77,8 @@ class TrendAgent(Agent):
             trend_direction (Literal[1, -1]): The direction of the trend (1 for upward, -1 for downward).
         """
         super().__init__(name, balance)
-        if trend_direction not in [1, -1]:
-            raise ValueError('Direction must be either  "1" or "-1"')
-        
+        check_trend_direction(trend_direction)
+
         self.trend_direction = trend_direction
 
     def act(self, market: Market):
@@ -150,4 +150,28 @@ class CustomAgent(Agent):
             self.max_buy_price = max(self.max_buy_price, market.price)
 
         self._base_act(action=action, market=market)
-        
\ No newline at end of file
+
+
+class StrategyAgent(Agent):
+    """
+    An agent driven by a declarative Strategy instead of hand written decision logic.
+    Its strategy state is kept in the `state` dict.
+    """
+    def __init__(self, name: str, balance: float, strategy: Strategy):
+        """
+        Args:
+            name (str): Name of the agent.
+            balance (float): Initial balance of the agent.
+            strategy (Strategy): The strategy that decides the agent's actions.
+        """
+        super().__init__(name, balance)
+        self.strategy: Strategy = strategy
+        self.state: dict = dict(strategy.state)
+
+    def act(self, market: Market):
+        """
+        Args:
+            market (Market): The market instance.
+        """
+        action: Action = self.strategy.decide(market, self)
+        self._base_act(action=action, market=market)
@@ -0,0 +1,258 @@
+import ast
+import keyword
+import math
+import random
+from typing import Callable, Optional, Union
+
+from src.utils import Action, check_trend_direction
+
+
+MARKET_VARIABLES: dict = {
+    'price': 'price',
+    'last_price': 'last_iterarion_price',
+    'stock': 'stock',
+    'iteration': 'iteration',
+    'iteration_limit': 'market_iteration_limit',
+}
+
+AGENT_VARIABLES: tuple = ('balance', 'graphics_cards', 'position')
+
+FUNCTIONS: dict = {
+    'randint': random.randint,
+    'max': max,
+    'min': min,
+    'abs': abs,
+    'round': round,
+}
+
+_RESERVED_NAMES: set = {'market', 'agent', 'action', 'choices', 'state', 'BUY', 'SELL', 'HOLD'}
+
+_ALLOWED_NODES: tuple = (
+    ast.Expression, ast.BoolOp, ast.BinOp, ast.UnaryOp, ast.Compare, ast.IfExp,
+    ast.Call, ast.Name, ast.Load, ast.Constant,
+    ast.And, ast.Or, ast.Not, ast.USub, ast.UAdd,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+    ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+)
+
+
+class Rule:
+    """
+    A single strategy rule: when its condition holds, the agent picks one of its actions.
+    """
+    def __init__(self, condition: Optional[str], actions: Union[Action, dict]):
+        """
+        Args:
+            condition (Optional[str]): Expression over market, agent and strategy state variables.
+                None makes the rule always match.
+            actions (Union[Action, dict]): The action to take, or a mapping of actions to
+                weights to choose one randomly.
+        """
+        if condition is not None and not isinstance(condition, str):
+            raise ValueError('Rule condition must be an expression string or None')
+
+        if isinstance(actions, Action):
+            actions = {actions: 1}
+
+        if not actions or any(not isinstance(action, Action) for action in actions):
+            raise ValueError('Rule actions must be an Action or a non empty dict of Action weights')
+
+        weights: list = list(actions.values())
+        if any(isinstance(weight, bool) or not isinstance(weight, (int, float))
+               or not math.isfinite(weight) or weight < 0 for weight in weights) or sum(weights) <= 0:
+            raise ValueError('Rule weights must be finite non negative numbers with a positive total')
+
+        self.condition: Optional[str] = condition
+        self.actions: dict = dict(actions)
+
+
+class Strategy:
+    """
+    A declarative agent strategy. Rules are checked in order and the first matching one
+    decides the action, then state updates are applied.
+
+    The strategy is validated and compiled once into a plain Python function, `decide`,
+    that chooses the action of one agent against the current market state.
+    """
+    def __init__(self, rules: list, state: Optional[dict] = None, updates: Optional[dict] = None):
+        """
+        Args:
+            rules (list[Rule]): Ordered rules. If none matches, the agent holds.
+            state (Optional[dict]): Extra per-agent variables and their initial values.
+            updates (Optional[dict]): State variables and the expressions that compute their new
+                value once the action is chosen. The chosen action is available as `action`.
+        """
+        self.rules: list = list(rules)
+        self.state: dict = dict(state or {})
+        self.updates: dict = dict(updates or {})
+
+        self._used_names: set = set()
+        self._validate_state()
+        self._conditions: list = self._validate_rules()
+        self._update_expressions: dict = {
+            name: self._check_expression(expression, extra_names=('action',))
+            for name, expression in self.updates.items()
+        }
+
+        self.decide: Callable = self._compile()
+
+    def _validate_state(self):
+        """
+        Checks that state variables are valid names that don't shadow built-in variables.
+        """
+        builtin_names: set = set(MARKET_VARIABLES) | set(AGENT_VARIABLES) | set(FUNCTIONS) | _RESERVED_NAMES
+
+        for name in self.state:
+            if not isinstance(name, str) or not name.isidentifier() or keyword.iskeyword(name) \
+                    or name.startswith('_') or name in builtin_names:
+                raise ValueError(f'Invalid strategy state variable "{name}"')
+
+        for name, expression in self.updates.items():
+            if not isinstance(expression, str):
+                raise ValueError(f'Update of "{name}" must be an expression string')
+            if name not in self.state:
+                raise ValueError(f'Update target "{name}" is not a strategy state variable')
+
+    def _validate_rules(self) -> list:
+        """
+        Checks every rule condition and that no rule follows an unconditional one.
+
+        Returns:
+            list: The code of each rule condition, None for the unconditional rule.
+        """
+        conditions: list = list()
+        for index, rule in enumerate(self.rules):
+            if rule.condition is None:
+                if index < len(self.rules) - 1:
+                    raise ValueError('Only the last rule can have no condition')
+                conditions.append(None)
+            else:
+                conditions.append(self._check_expression(rule.condition))
+
+        return conditions
+
+    def _check_expression(self, expression: str, extra_names: tuple = ()) -> str:
+        """
+        Validates that an expression only uses the supported syntax and known names.
+
+        Args:
+            expression (str): The expression to validate.
+            extra_names (tuple): Additional names available to the expression.
+
+        Returns:
+            str: The expression, regenerated from its syntax tree to be embedded in generated code.
+        """
+        try:
+            tree = ast.parse(expression, mode='eval')
+        except SyntaxError as e:
+            raise ValueError(f'Invalid strategy expression "{expression}": {e.msg}') from e
+
+        known_names: set = set(MARKET_VARIABLES) | set(AGENT_VARIABLES) | set(self.state) | set(extra_names)
+        known_names |= {action.name for action in Action}
+
+        for node in ast.walk(tree):
+            if not isinstance(node, _ALLOWED_NODES):
+                raise ValueError(f'Unsupported syntax in strategy expression "{expression}"')
+            if isinstance(node, ast.Call):
+                if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS or node.keywords:
+                    raise ValueError(f'Unsupported call in strategy expression "{expression}"')
+            elif isinstance(node, ast.Name):
+                if node.id not in known_names and node.id not in FUNCTIONS:
+                    raise ValueError(f'Unknown name "{node.id}" in strategy expression "{expression}"')
+                self._used_names.add(node.id)
+
+        return f'({ast.unparse(tree)})'
+
+    def _compile(self) -> Callable:
+        """
+        Generates and compiles the decision function for this strategy. Only the market, agent
+        and state variables used by the expressions are read.
+
+        Returns:
+            Callable: A function `(market, agent) -> Action` that also applies the state updates
+                on the agent.
+        """
+        namespace: dict = dict(FUNCTIONS)
+        namespace.update({'choices': random.choices, 'BUY': Action.BUY, 'SELL': Action.SELL, 'HOLD': Action.HOLD})
+
+        lines: list = ['def decide(market, agent):']
+        lines += [f'    {name} = market.{attribute}' for name, attribute in MARKET_VARIABLES.items()
+                  if name in self._used_names]
+        lines += [f'    {name} = agent.{name}' for name in AGENT_VARIABLES if name in self._used_names]
+        used_state: list = [name for name in self.state if name in self._used_names or name in self.updates]
+        if used_state:
+            lines.append('    state = agent.state')
+            lines += [f'    {name} = state[{name!r}]' for name in used_state]
+
+        for index, (rule, condition) in enumerate(zip(self.rules, self._conditions)):
+            if condition is None:
+                lines.append('    else:' if index else '    if True:')
+            else:
+                lines.append(f'    {"elif" if index else "if"} {condition}:')
+            lines.append(f'        action = {self._action_expression(rule, index, namespace)}')
+
+        if not self.rules:
+            lines.append('    action = HOLD')
+        elif self._conditions[-1] is not None:
+            lines += ['    else:', '        action = HOLD']
+
+        for name, expression in self._update_expressions.items():
+            lines.append(f'    {name} = {expression}')
+            lines.append(f'    state[{name!r}] = {name}')
+
+        lines.append('    return action')
+
+        exec(compile('\n'.join(lines), '<strategy>', 'exec'), namespace)
+        return namespace['decide']
+
+    @staticmethod
+    def _action_expression(rule: Rule, index: int, namespace: dict) -> str:
+        """
+        Builds the code that selects a rule's action, registering its constants in the namespace.
+        """
+        if len(rule.actions) == 1:
+            return next(iter(rule.actions)).name
+
+        namespace[f'_actions_{index}'] = list(rule.actions)
+        namespace[f'_weights_{index}'] = list(rule.actions.values())
+        return f'choices(_actions_{index}, weights=_weights_{index}, k=1)[0]'
+
+
+def trend_strategy(trend_direction: int) -> Strategy:
+    """
+    Strategy equivalent to TrendAgent.
+
+    Args:
+        trend_direction (int): The direction of the trend (1 for upward, -1 for downward).
+    """
+    check_trend_direction(trend_direction)
+
+    return Strategy(
+        rules=[
+            Rule(f'price >= last_price * (1 + {trend_direction} * 0.01)', {Action.BUY: 75, Action.HOLD: 25}),
+            Rule(None, {Action.SELL: 20, Action.HOLD: 80}),
+        ],
+    )
+
+
+def custom_strategy() -> Strategy:
+    """
+    Strategy equivalent to CustomAgent.
+    """
+    trend: str = 'price >= last_price * (1 + 0.01) or price >= last_price * (1 - 0.01)'
+
+    return Strategy(
+        rules=[
+            Rule('iteration_limit - iteration == graphics_cards', Action.SELL),
+            Rule('iteration_limit - iteration == graphics_cards + 1', Action.HOLD),
+            Rule(f'({trend}) and randint(0, 99) < position and balance >= price', Action.BUY),
+            Rule(f'({trend}) and graphics_cards > 0', Action.SELL),
+            Rule(trend, Action.HOLD),
+            Rule('randint(0, 99) > position and balance >= price', Action.BUY),
+            Rule('max_buy_price * 1.7 < price and graphics_cards > 0', Action.SELL),
+            Rule('max_buy_price * 1.1 < price and graphics_cards > 0 and balance >= price', Action.SELL),
+            Rule('iteration < 4', Action.BUY),
+        ],
+        state={'max_buy_price': 0},
+        updates={'max_buy_price': 'max(max_buy_price, price) if action == BUY else max_buy_price'},
+    )
@@ -10,4 +10,12 @@ class Action(Enum):
 operation_sign: dict = {
     Action.BUY: -1,
     Action.SELL: 1
-}
\ No newline at end of file
+}
+
+
+def check_trend_direction(trend_direction: int):
+    """
+    Raises a ValueError if the trend direction is not 1 (upward) or -1 (downward).
+    """
+    if trend_direction not in [1, -1]:
+        raise ValueError('Direction must be either "1" or "-1"')
@@ -0,0 +1,16 @@
+import pytest
+from unittest.mock import MagicMock
+from src.market import Market
+
+@pytest.fixture
+def mock_market():
+    """Provides a mock Market instance."""
+    market = MagicMock(spec=Market)
+    market.price = 100.0
+    market.last_iterarion_price = 95.0
+    market.stock = 50
+    market.iteration = 0
+    market.market_iteration_limit = 1000
+    market.execute_action.return_value = True
+
+    return market
@@ -1,21 +1,6 @@
 import pytest
-from unittest.mock import MagicMock
-from src.market import Market
 from src.agent import RandomAgent, TrendAgent, CustomAgent
 
-@pytest.fixture
-def mock_market():
-    """Provides a mock Market instance."""
-    market = MagicMock(spec=Market)
-    market.price = 100.0
-    market.last_iterarion_price = 95.0
-    market.stock = 50
-    market.iteration = 0
-    market.market_iteration_limit = 1000
-    market.execute_action.return_value = True
-    
-    return market
-
 @pytest.fixture
 def random_agent():
     """Provides a RandomAgent instance."""
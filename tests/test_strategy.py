@@ -0,0 +1,147 @@
+import random
+
+import pytest
+from unittest.mock import patch
+from src.agent import Agent, CustomAgent, StrategyAgent, TrendAgent
+from src.strategy import Rule, Strategy, custom_strategy, trend_strategy
+from src.utils import Action
+
+def _agent_states():
+    """Yields (price, last_price, iteration, balance, cards, position) combinations."""
+    for price, last_price in [(100.0, 95.0), (100.0, 100.0), (90.0, 100.0), (120.0, 100.0)]:
+        for iteration in [2, 50, 998, 999]:
+            for balance, cards in [(1000.0, 0), (1000.0, 1), (50.0, 2)]:
+                for position in [0, 50, 99]:
+                    yield price, last_price, iteration, balance, cards, position
+
+def _chosen_action(agent, market, seed):
+    """Runs agent.act with a fixed seed and returns the action passed to _base_act."""
+    random.seed(seed)
+    with patch.object(Agent, '_base_act') as base_act:
+        agent.act(market)
+    return base_act.call_args.kwargs['action']
+
+def test_strategy_first_matching_rule(mock_market):
+    """Test rules are evaluated in order and the first matching one decides."""
+    strategy = Strategy(rules=[Rule('price > 1000', Action.SELL),
+                               Rule('balance >= price', Action.BUY),
+                               Rule(None, Action.SELL)])
+    agent = StrategyAgent(name="Agent", balance=1000.0, strategy=strategy)
+
+    assert strategy.decide(mock_market, agent) == Action.BUY
+
+def test_strategy_holds_without_match(mock_market):
+    """Test the agent holds when no rule matches."""
+    strategy = Strategy(rules=[Rule('price > 1000', Action.BUY)])
+    agent = StrategyAgent(name="Agent", balance=1000.0, strategy=strategy)
+
+    assert strategy.decide(mock_market, agent) == Action.HOLD
+
+def test_strategy_state_updates(mock_market):
+    """Test state variables are kept per agent and updated after each decision."""
+    strategy = Strategy(rules=[Rule(None, Action.BUY)],
+                        state={'buys': 0},
+                        updates={'buys': 'buys + 1 if action == BUY else buys'})
+    agents = [StrategyAgent(name=f"Agent_{i}", balance=1000.0, strategy=strategy) for i in range(3)]
+
+    strategy.decide(mock_market, agents[0])
+    strategy.decide(mock_market, agents[0])
+    strategy.decide(mock_market, agents[1])
+
+    assert [agent.state['buys'] for agent in agents] == [2, 1, 0]
+    assert strategy.state == {'buys': 0}
+
+def test_strategy_state_does_not_touch_agent_attributes(mock_market):
+    """Test state variables named like agent attributes don't overwrite them."""
+    strategy = Strategy(rules=[Rule('name > 0', Action.BUY)], state={'name': 1, 'act': 0})
+    agent = StrategyAgent(name="Agent", balance=1000.0, strategy=strategy)
+
+    agent.act(mock_market)
+    assert agent.name == "Agent"
+    mock_market.execute_action.assert_called_once_with(action=Action.BUY, agent_name="Agent")
+
+def test_strategy_expression_with_comment(mock_market):
+    """Test expressions are embedded from their syntax tree, so trailing comments are harmless."""
+    strategy = Strategy(rules=[Rule('price > 1 # note', Action.BUY)])
+    agent = StrategyAgent(name="Agent", balance=1000.0, strategy=strategy)
+
+    assert strategy.decide(mock_market, agent) == Action.BUY
+
+@pytest.mark.parametrize("expression", ["unknown > 1", "__import__('os')", "price.real > 1", "price >"])
+def test_strategy_invalid_expression(expression):
+    """Test invalid or unsafe expressions are rejected."""
+    with pytest.raises(ValueError):
+        Strategy(rules=[Rule(expression, Action.BUY)])
+
+def test_strategy_rule_after_default():
+    """Test rules can't follow the unconditional rule."""
+    with pytest.raises(ValueError):
+        Strategy(rules=[Rule(None, Action.BUY), Rule('price > 1', Action.SELL)])
+
+@pytest.mark.parametrize("weights", [{Action.BUY: 0, Action.SELL: 0},
+                                     {Action.BUY: -5, Action.SELL: 1},
+                                     {Action.BUY: "1", Action.SELL: 1},
+                                     {Action.BUY: float('nan'), Action.SELL: 1},
+                                     {Action.BUY: float('inf'), Action.SELL: 1}])
+def test_rule_invalid_weights(weights):
+    """Test rule weights must be finite non negative numbers with a positive total."""
+    with pytest.raises(ValueError):
+        Rule(None, weights)
+
+def test_rule_invalid_condition():
+    """Test rule conditions must be expression strings or None."""
+    with pytest.raises(ValueError):
+        Rule(5, Action.BUY)
+
+def test_strategy_invalid_state():
+    """Test state variables can't shadow built-in variables and updates must target state."""
+    with pytest.raises(ValueError):
+        Strategy(rules=[], state={'price': 0})
+
+    with pytest.raises(ValueError):
+        Strategy(rules=[], state={'state': 0})
+
+    with pytest.raises(ValueError):
+        Strategy(rules=[], updates={'balance': 'balance + 1'})
+
+    with pytest.raises(ValueError):
+        Strategy(rules=[], state={'buys': 0}, updates={'buys': 1})
+
+@pytest.mark.parametrize("trend_direction", [1, -1])
+def test_trend_strategy_matches_trend_agent(mock_market, trend_direction):
+    """Test the declarative trend strategy chooses the same actions as TrendAgent."""
+    strategy = trend_strategy(trend_direction)
+
+    for price, last_price, iteration, balance, cards, position in _agent_states():
+        mock_market.price = price
+        mock_market.last_iterarion_price = last_price
+        trend_agent = TrendAgent(name="TrendAgent", balance=balance, trend_direction=trend_direction)
+        strategy_agent = StrategyAgent(name="StrategyAgent", balance=balance, strategy=strategy)
+        trend_agent.graphics_cards = strategy_agent.graphics_cards = cards
+
+        seed = iteration + position
+        assert _chosen_action(strategy_agent, mock_market, seed) == _chosen_action(trend_agent, mock_market, seed)
+
+def test_trend_strategy_invalid_direction():
+    """Test the trend strategy rejects invalid directions."""
+    with pytest.raises(ValueError):
+        trend_strategy(0)
+
+def test_custom_strategy_matches_custom_agent(mock_market):
+    """Test the declarative custom strategy chooses the same actions as CustomAgent."""
+    strategy = custom_strategy()
+
+    for price, last_price, iteration, balance, cards, position in _agent_states():
+        mock_market.price = price
+        mock_market.last_iterarion_price = last_price
+        mock_market.iteration = iteration
+        custom_agent = CustomAgent(name="CustomAgent", balance=balance)
+        strategy_agent = StrategyAgent(name="StrategyAgent", balance=balance, strategy=strategy)
+        for agent in (custom_agent, strategy_agent):
+            agent.graphics_cards = cards
+            agent.position = position
+        custom_agent.max_buy_price = strategy_agent.state['max_buy_price'] = 60
+
+        seed = iteration + position
+        assert _chosen_action(strategy_agent, mock_market, seed) == _chosen_action(custom_agent, mock_market, seed)
+        assert strategy_agent.state['max_buy_price'] == custom_agent.max_buy_price